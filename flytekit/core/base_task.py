@@ -18,11 +18,13 @@
 
 import asyncio
 import collections
+import contextvars
 import datetime
 import inspect
 import warnings
 from abc import abstractmethod
 from base64 import b64encode
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import (
     Any,
@@ -66,7 +68,13 @@ from flytekit.core.promise import (
     translate_inputs_to_literals,
 )
 from flytekit.core.tracker import TrackedInstance
-from flytekit.core.type_engine import TypeEngine, TypeTransformerFailedError
+from flytekit.core.type_engine import (
+    MAX_CONCURRENT_BLOB_UPLOADS,
+    TypeEngine,
+    TypeTransformerFailedError,
+    is_file_or_directory_type,
+    is_local_path,
+)
 from flytekit.core.utils import timeit
 from flytekit.loggers import logger
 from flytekit.models import dynamic_job as _dynamic_job
@@ -600,21 +608,36 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
         with timeit("Translate the output to literals"):
             literals = {}
             omt = ctx.output_metadata_tracker
-            for i, (k, v) in enumerate(native_outputs_as_map.items()):
-                literal_type = self._outputs_interface[k].type
-                py_type = self.get_type_for_output_var(k, v)
-
-                if isinstance(v, tuple):
-                    raise TypeError(f"Output({k}) in task '{self.name}' received a tuple {v}, instead of {py_type}")
-                try:
-                    lit = TypeEngine.to_literal(ctx, v, py_type, literal_type)
-                    literals[k] = lit
-                except Exception as e:
-                    # only show the name of output key if it's user-defined (by default Flyte names these as "o<n>")
-                    key = k if k != f"o{i}" else i
-                    msg = f"Failed to convert outputs of task '{self.name}' at position {key}:\n  {e}"
-                    logger.error(msg)
-                    raise TypeError(msg) from e
+            outputs = list(native_outputs_as_map.items())
+            # Local files and directories are uploaded to the blob store while being converted. That is network bound,
+            # so if a task returns more than one of them they are converted concurrently.
+            blob_outputs = [
+                i
+                for i, (k, v) in enumerate(outputs)
+                if self._outputs_interface[k].type.blob is not None
+                and is_file_or_directory_type(self.get_type_for_output_var(k, v))
+                and is_local_path(ctx, v)
+            ]
+            futures: Dict[int, Future] = {}
+            executor = None
+            if len(blob_outputs) > 1:
+                executor = ThreadPoolExecutor(max_workers=min(len(blob_outputs), MAX_CONCURRENT_BLOB_UPLOADS))
+                for i in blob_outputs:
+                    k, v = outputs[i]
+                    futures[i] = executor.submit(contextvars.copy_context().run, self._output_to_literal, ctx, i, k, v)
+            try:
+                for i, (k, v) in enumerate(outputs):
+                    literals[k] = futures[i].result() if i in futures else self._output_to_literal(ctx, i, k, v)
+            except Exception:
+                for f in futures.values():
+                    f.cancel()
+                raise
+            finally:
+                if executor is not None:
+                    executor.shutdown()
+
+            for k, v in outputs:
+                lit = literals[k]
                 # Now check if there is any output metadata associated with this output variable and attach it to the
                 # literal
                 if omt is not None:
@@ -641,6 +664,20 @@ class PythonTask(TrackedInstance, Task, Generic[T]):
 
         return _literal_models.LiteralMap(literals=literals), native_outputs_as_map
 
+    def _output_to_literal(self, ctx: FlyteContext, i: int, k: str, v: Any) -> _literal_models.Literal:
+        py_type = self.get_type_for_output_var(k, v)
+
+        if isinstance(v, tuple):
+            raise TypeError(f"Output({k}) in task '{self.name}' received a tuple {v}, instead of {py_type}")
+        try:
+            return TypeEngine.to_literal(ctx, v, py_type, self._outputs_interface[k].type)
+        except Exception as e:
+            # only show the name of output key if it's user-defined (by default Flyte names these as "o<n>")
+            key = k if k != f"o{i}" else i
+            msg = f"Failed to convert outputs of task '{self.name}' at position {key}:\n  {e}"
+            logger.error(msg)
+            raise TypeError(msg) from e
+
     def _write_decks(self, native_inputs, native_outputs_as_map, ctx, new_user_params):
         if self._disable_deck is False:
             from flytekit.deck.deck import Deck, _output_deck
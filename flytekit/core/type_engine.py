@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import collections
+import contextvars
 import copy
 import dataclasses
 import datetime as _datetime
@@ -13,6 +14,7 @@ import sys
 import textwrap
 import typing
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import Dict, List, NamedTuple, Optional, Type, cast
 
@@ -60,6 +62,8 @@ from flytekit.models.types import LiteralType, SimpleType, StructuredDatasetType
 T = typing.TypeVar("T")
 DEFINITIONS = "definitions"
 TITLE = "title"
+# Upper bound on the number of files and directories that are uploaded at the same time.
+MAX_CONCURRENT_BLOB_UPLOADS = 10
 
 
 class BatchSize:
@@ -75,6 +79,10 @@ class BatchSize:
     downloads 10 files, loads them to memory, then writes those 10 to local disk, then it loads the next 10, so on
     and so forth. Similarly, for outputs, in this case flytekit is going to upload the resulting directory in chunks of
     100.
+
+    It can also annotate a FlyteFile, e.g. ``Annotated[FlyteFile, BatchSize(4)]``. A single file is uploaded as one
+    batch, so here it caps the number of parts of a multipart upload that are in flight (and held in memory) at once.
+    That only applies where the filesystem takes a concurrency limit (s3fs); it is ignored for gcsfs and adlfs.
     """
 
     def __init__(self, val: int):
@@ -93,6 +101,26 @@ def get_batch_size(t: Type) -> Optional[int]:
     return None
 
 
+def is_file_or_directory_type(t: Type) -> bool:
+    """
+    Whether ``t`` is handled by the FlyteFile or FlyteDirectory transformer, i.e. its values are paths that get
+    copied to the blob store when they are converted to literals.
+    """
+    from flytekit.types.directory.types import FlyteDirToMultipartBlobTransformer
+    from flytekit.types.file.file import FlyteFilePathTransformer
+
+    return isinstance(TypeEngine.get_transformer(t), (FlyteFilePathTransformer, FlyteDirToMultipartBlobTransformer))
+
+
+def is_local_path(ctx: FlyteContext, v: typing.Any) -> bool:
+    """
+    Whether a file or directory value still points at local data, so converting it uploads something. Values that
+    were downloaded from, or already point to, a remote location are passed through as-is.
+    """
+    path = getattr(v, "_remote_source", None) or getattr(v, "path", v)
+    return path is not None and not ctx.file_access.is_remote(str(path))
+
+
 def modify_literal_uris(lit: Literal):
     """
     Modifies the literal object recursively to replace the URIs with the native paths in case they are of
@@ -597,7 +625,7 @@ class DataclassTransformer(TypeTransformer[object]):
 
     def _deserialize_flyte_type(self, python_val: T, expected_python_type: Type) -> Optional[T]:
         from flytekit.types.directory.types import FlyteDirectory, FlyteDirToMultipartBlobTransformer
-        from flytekit.types.file.file import FlyteFile, FlyteFilePathTransformer
+        from flytekit.types.file.file import FlyteFile, flyte_file_transformer
         from flytekit.types.schema.types import FlyteSchema, FlyteSchemaTransformer
         from flytekit.types.structured.structured_dataset import StructuredDataset, StructuredDatasetTransformerEngine
 
@@ -630,7 +658,7 @@ class DataclassTransformer(TypeTransformer[object]):
                 expected_python_type,
             )
         elif issubclass(expected_python_type, FlyteFile):
-            return FlyteFilePathTransformer().to_python_value(
+            return flyte_file_transformer.to_python_value(
                 FlyteContext.current_context(),
                 Literal(
                     scalar=Scalar(
@@ -1373,7 +1401,31 @@ class ListTransformer(TypeTransformer[T]):
                 lit_list = []
         else:
             t = self.get_sub_type(python_type)
-            lit_list = [TypeEngine.to_literal(ctx, x, t, expected.collection_type) for x in python_val]  # type: ignore
+            if (
+                len(python_val) > 1
+                and expected.collection_type is not None
+                and expected.collection_type.blob
+                and is_file_or_directory_type(t)
+                and sum(is_local_path(ctx, x) for x in python_val) > 1
+            ):
+                # Every local file or directory in the list is a separate upload, and for many small files the
+                # per-request latency dominates, so keep several of them in flight at once.
+                with ThreadPoolExecutor(max_workers=min(len(python_val), MAX_CONCURRENT_BLOB_UPLOADS)) as executor:
+                    futures = [
+                        executor.submit(
+                            contextvars.copy_context().run, TypeEngine.to_literal, ctx, x, t, expected.collection_type
+                        )
+                        for x in python_val
+                    ]
+                    try:
+                        lit_list = [f.result() for f in futures]
+                    except Exception:
+                        # Don't start the uploads that are still queued, the conversion fails anyway.
+                        for f in futures:
+                            f.cancel()
+                        raise
+            else:
+                lit_list = [TypeEngine.to_literal(ctx, x, t, expected.collection_type) for x in python_val]  # type: ignore
         return Literal(collection=LiteralCollection(literals=lit_list))
 
     def to_python_value(self, ctx: FlyteContext, lv: Literal, expected_python_type: Type[T]) -> typing.List[typing.Any]:  # type: ignore
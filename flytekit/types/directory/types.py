@@ -5,7 +5,6 @@ import pathlib
 import random
 import typing
 from dataclasses import dataclass, field
-from pathlib import Path
 from typing import Any, Generator, Tuple
 from uuid import UUID
 
@@ -437,10 +436,8 @@ class FlyteDirToMultipartBlobTransformer(TypeTransformer[FlyteDirectory]):
 
             if ctx.file_access.is_remote(source_path):
                 should_upload = False
-            else:
-                p = Path(source_path)
-                if not p.is_dir():
-                    raise ValueError(f"Expected a directory. {source_path} is not a directory")
+            elif not os.path.isdir(source_path):
+                raise ValueError(f"Expected a directory. {source_path} is not a directory")
         else:
             raise AssertionError(f"Expected FlyteDirectory or os.PathLike object, received {type(python_val)}")
 
@@ -448,7 +445,7 @@ class FlyteDirToMultipartBlobTransformer(TypeTransformer[FlyteDirectory]):
         if should_upload:
             if remote_directory is None:
                 remote_directory = ctx.file_access.get_random_remote_directory()
-            if not pathlib.Path(source_path).is_dir():
+            if not os.path.isdir(source_path):
                 raise FlyteAssertion("Expected a directory. {} is not a directory".format(source_path))
             ctx.file_access.put_data(source_path, remote_directory, is_multipart=True, batch_size=batch_size)
             return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_directory)))
@@ -3,16 +3,25 @@ from __future__ import annotations
 import mimetypes
 import os
 import pathlib
+import sys
 import typing
 from contextlib import contextmanager
 from dataclasses import dataclass, field
+from functools import lru_cache
 
 from dataclasses_json import config
 from marshmallow import fields
 from mashumaro.mixins.json import DataClassJSONMixin
 
 from flytekit.core.context_manager import FlyteContext, FlyteContextManager
-from flytekit.core.type_engine import TypeEngine, TypeTransformer, TypeTransformerFailedError, get_underlying_type
+from flytekit.core.data_persistence import FileAccessProvider
+from flytekit.core.type_engine import (
+    TypeEngine,
+    TypeTransformer,
+    TypeTransformerFailedError,
+    get_batch_size,
+    get_underlying_type,
+)
 from flytekit.exceptions.user import FlyteAssertion
 from flytekit.loggers import logger
 from flytekit.models.core.types import BlobType
@@ -25,9 +34,43 @@ def noop():
     ...
 
 
+class _Downloader(object):
+    """
+    Lazily fetches a remote file when a FlyteFile is first opened. This is a plain class rather than a closure so that
+    FlyteFile objects returned by the transformer can be pickled.
+    """
+
+    __slots__ = ("file_access", "remote_path", "local_path")
+
+    def __init__(self, file_access: FileAccessProvider, remote_path: str, local_path: str):
+        self.file_access = file_access
+        self.remote_path = remote_path
+        self.local_path = local_path
+
+    def __call__(self):
+        return self.file_access.get_data(self.remote_path, self.local_path, is_multipart=False)
+
+
 T = typing.TypeVar("T")
 
 
+# BlobType and BlobMetadata have no setters, so one instance per format can be shared by every literal. LiteralType
+# is not cached the same way since the type engine mutates it in place (e.g. tagging union variants).
+@lru_cache(maxsize=64)
+def _blob_type(format: str) -> BlobType:
+    return BlobType(format=format, dimensionality=BlobType.BlobDimensionality.SINGLE)
+
+
+@lru_cache(maxsize=64)
+def _blob_metadata(format: str) -> BlobMetadata:
+    return BlobMetadata(type=_blob_type(format))
+
+
+# FlyteFile["csv"] and friends are created once per format and reused, rather than building a new class on every
+# subscription.
+_FORMAT_CLASS_CACHE: typing.Dict[str, typing.Type[FlyteFile]] = {}
+
+
 @dataclass
 class FlyteFile(os.PathLike, typing.Generic[T], DataClassJSONMixin):
     path: typing.Union[str, os.PathLike] = field(default=None, metadata=config(mm_field=fields.String()))  # type: ignore
@@ -143,9 +186,17 @@ class FlyteFile(os.PathLike, typing.Generic[T], DataClassJSONMixin):
             return "/tmp/local_file.csv"
     """
 
+    # Set on the classes returned by FlyteFile["<format>"]. Not annotated, so it stays a class attribute rather than
+    # a dataclass field.
+    _extension = ""
+
+    # The private state lives in slots. ``path`` stays in the instance dict (os.PathLike does not declare slots, so the
+    # dict is there regardless) because it is a dataclass field with a default.
+    __slots__ = ("_downloader", "_downloaded", "_remote_path", "_remote_source")
+
     @classmethod
     def extension(cls) -> str:
-        return ""
+        return cls._extension
 
     @classmethod
     def new_remote_file(cls, name: typing.Optional[str] = None) -> FlyteFile:
@@ -163,16 +214,8 @@ class FlyteFile(os.PathLike, typing.Generic[T], DataClassJSONMixin):
         Create a new FlyteFile object with the remote source set to the input
         """
         ctx = FlyteContextManager.current_context()
-        lit = Literal(
-            scalar=Scalar(
-                blob=Blob(
-                    metadata=BlobMetadata(type=BlobType(format="", dimensionality=BlobType.BlobDimensionality.SINGLE)),
-                    uri=source,
-                )
-            )
-        )
-        t = FlyteFilePathTransformer()
-        return t.to_python_value(ctx, lit, cls)
+        lit = Literal(scalar=Scalar(blob=Blob(metadata=_blob_metadata(""), uri=source)))
+        return flyte_file_transformer.to_python_value(ctx, lit, cls)
 
     def __class_getitem__(cls, item: typing.Union[str, typing.Type]) -> typing.Type[FlyteFile]:
         from flytekit.types.file import FileExt
@@ -182,19 +225,14 @@ class FlyteFile(os.PathLike, typing.Generic[T], DataClassJSONMixin):
 
         item_string = FileExt.check_and_convert_to_str(item)
 
-        item_string = item_string.strip().lstrip("~").lstrip(".")
+        item_string = sys.intern(item_string.strip().lstrip("~").lstrip("."))
         if item == "":
             return cls
 
-        class _SpecificFormatClass(FlyteFile):
-            # Get the type engine to see this as kind of a generic
-            __origin__ = FlyteFile
-
-            @classmethod
-            def extension(cls) -> str:
-                return item_string
-
-        return _SpecificFormatClass
+        format_class = _FORMAT_CLASS_CACHE.get(item_string)
+        if format_class is None:
+            format_class = _FORMAT_CLASS_CACHE[item_string] = _make_format_class(item_string)
+        return format_class
 
     def __init__(
         self,
@@ -221,12 +259,26 @@ class FlyteFile(os.PathLike, typing.Generic[T], DataClassJSONMixin):
         self._remote_source: typing.Optional[str] = None
 
     def __fspath__(self):
+        if self._downloaded:
+            return self.path
         # This is where a delayed downloading of the file will happen
-        if not self._downloaded:
-            self._downloader()
-            self._downloaded = True
+        self._downloader()
+        self._downloaded = True
+        # The downloader won't run again, so let go of it and whatever it holds on to (e.g. the file access provider).
+        self._downloader = noop
         return self.path
 
+    def __getstate__(self):
+        # Pickle protocols 0 and 1 refuse classes with __slots__ unless they define their own state methods.
+        slots = {s: getattr(self, s) for s in FlyteFile.__slots__ if hasattr(self, s)}
+        return self.__dict__, slots
+
+    def __setstate__(self, state):
+        instance_dict, slots = state
+        self.__dict__.update(instance_dict)
+        for name, value in slots.items():
+            setattr(self, name, value)
+
     def __eq__(self, other):
         if isinstance(other, FlyteFile):
             return (
@@ -315,6 +367,46 @@ class FlyteFile(os.PathLike, typing.Generic[T], DataClassJSONMixin):
         return self.path
 
 
+@lru_cache(maxsize=128)
+def _is_flyte_file_type(t: typing.Any) -> bool:
+    # FlyteFile is an os.PathLike ABC, so issubclass goes through ABCMeta on every call. The set of types seen here
+    # is small, so the answer is cached per type.
+    return isinstance(t, type) and issubclass(t, FlyteFile)
+
+
+# What the transformer derives from a FlyteFile type (its format, the blob metadata, the class to return) depends only
+# on the type, so it is resolved once per type instead of on every conversion.
+@lru_cache(maxsize=128)
+def _blob_metadata_for_type(t: typing.Union[typing.Type[FlyteFile], os.PathLike]) -> BlobMetadata:
+    return _blob_metadata(FlyteFilePathTransformer.get_format(t))
+
+
+@lru_cache(maxsize=128)
+def _format_class_for_type(t: typing.Type[FlyteFile]) -> typing.Type[FlyteFile]:
+    return FlyteFile.__class_getitem__(FlyteFilePathTransformer.get_format(t))
+
+
+def _make_format_class(item_string: str) -> typing.Type[FlyteFile]:
+    class _SpecificFormatClass(FlyteFile):
+        # Get the type engine to see this as kind of a generic
+        __slots__ = ()
+        __origin__ = FlyteFile
+        _extension = item_string
+
+        def __reduce_ex__(self, protocol):
+            if type(self) is not _SpecificFormatClass:
+                return super().__reduce_ex__(protocol)
+            # The class is created at runtime and can't be found by name, so unpickling goes through FlyteFile[...]
+            return _new_format_file, (self._extension,), self.__getstate__()
+
+    return _SpecificFormatClass
+
+
+def _new_format_file(extension: str) -> FlyteFile:
+    cls = FlyteFile.__class_getitem__(extension)
+    return cls.__new__(cls)
+
+
 class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
     def __init__(self):
         super().__init__(name="FlyteFilePath", t=FlyteFile)
@@ -323,15 +415,17 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
     def get_format(t: typing.Union[typing.Type[FlyteFile], os.PathLike]) -> str:
         if t is os.PathLike:
             return ""
-        return typing.cast(FlyteFile, t).extension()
+        # The format is a key of the blob type caches. FlyteFile["fmt"] classes already hold an interned string, this
+        # covers subclasses that override extension().
+        return sys.intern(typing.cast(FlyteFile, t).extension())
 
     def _blob_type(self, format: str) -> BlobType:
-        return BlobType(format=format, dimensionality=BlobType.BlobDimensionality.SINGLE)
+        return _blob_type(format)
 
     def assert_type(
         self, t: typing.Union[typing.Type[FlyteFile], os.PathLike], v: typing.Union[FlyteFile, os.PathLike, str]
     ):
-        if isinstance(v, os.PathLike) or isinstance(v, FlyteFile) or isinstance(v, str):
+        if isinstance(v, (os.PathLike, FlyteFile, str)):
             return
         raise TypeError(
             f"No automatic conversion found from type {type(v)} to FlyteFile."
@@ -365,10 +459,11 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
         it logs a debug message and returns. If the actual file does not exist, it returns without raising an error.
 
         :param python_type: The expected type of the file
-        :param source_path: The path to the file to validate
+        :param source_path: The local path to the file to validate. Callers skip remote paths.
         :raises ValueError: If the real type of the file is not the same as the expected python_type
         """
-        if FlyteFilePathTransformer.get_format(python_type) == "":
+        expected_format = FlyteFilePathTransformer.get_format(python_type)
+        if expected_format == "":
             return
 
         try:
@@ -379,18 +474,10 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
             logger.debug(f"Libmagic is not installed. Error message: {e}")
             return
 
-        ctx = FlyteContext.current_context()
-        if ctx.file_access.is_remote(source_path):
-            # Skip validation for remote files. One of the use cases for FlyteFile is to point to remote files,
-            # you might have access to a remote file (e.g., in s3) that you want to pass to a Flyte workflow.
-            # Therefore, we should only validate FlyteFiles for which their path is considered local.
-            return
-
-        if FlyteFilePathTransformer.get_format(python_type):
-            real_type = magic.from_file(source_path, mime=True)
-            expected_type = self.get_mime_type_from_extension(FlyteFilePathTransformer.get_format(python_type))
-            if real_type != expected_type:
-                raise ValueError(f"Incorrect file type, expected {expected_type}, got {real_type}")
+        real_type = magic.from_file(source_path, mime=True)
+        expected_type = self.get_mime_type_from_extension(expected_format)
+        if real_type != expected_type:
+            raise ValueError(f"Incorrect file type, expected {expected_type}, got {real_type}")
 
     def to_literal(
         self,
@@ -405,18 +492,24 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
         if python_val is None:
             raise TypeTransformerFailedError("None value cannot be converted to a file.")
 
+        batch_size = get_batch_size(python_type)
+
         # Correctly handle `Annotated[FlyteFile, ...]` by extracting the origin type
         python_type = get_underlying_type(python_type)
 
-        if not (python_type is os.PathLike or issubclass(python_type, FlyteFile)):
+        if not (python_type is os.PathLike or _is_flyte_file_type(python_type)):
             raise ValueError(f"Incorrect type {python_type}, must be either a FlyteFile or os.PathLike")
 
         # information used by all cases
-        meta = BlobMetadata(type=self._blob_type(format=FlyteFilePathTransformer.get_format(python_type)))
+        meta = _blob_metadata_for_type(python_type)
 
         if isinstance(python_val, FlyteFile):
             source_path = python_val.path
-            self.validate_file_type(python_type, source_path)
+            is_remote = ctx.file_access.is_remote(source_path)
+            # Only local files are validated. One of the use cases for FlyteFile is to point to remote files (e.g. in
+            # s3) that you want to pass to a Flyte workflow.
+            if not is_remote:
+                self.validate_file_type(python_type, source_path)
 
             # If the object has a remote source, then we just convert it back. This means that if someone is just
             # going back and forth between a FlyteFile Python value and a Blob Flyte IDL value, we don't do anything.
@@ -426,7 +519,7 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
             # If the user specified the remote_path to be False, that means no matter what, do not upload. Also if the
             # path given is already a remote path, say https://www.google.com, the concept of uploading to the Flyte
             # blob store doesn't make sense.
-            if python_val.remote_path is False or ctx.file_access.is_remote(source_path):
+            if python_val.remote_path is False or is_remote:
                 should_upload = False
             # If the type that's given is a simpler type, we also don't upload, and print a warning too.
             if python_type is os.PathLike:
@@ -439,21 +532,18 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
             # Set the remote destination if one was given instead of triggering a random one below
             remote_path = python_val.remote_path or None
 
-        elif isinstance(python_val, pathlib.Path) or isinstance(python_val, str):
-            source_path = str(python_val)
-            if issubclass(python_type, FlyteFile):
-                self.validate_file_type(python_type, source_path)
+        elif isinstance(python_val, (pathlib.Path, str)):
+            source_path = python_val if type(python_val) is str else os.fspath(python_val)
+            if _is_flyte_file_type(python_type):
                 if ctx.file_access.is_remote(source_path):
                     should_upload = False
                 else:
-                    if isinstance(python_val, pathlib.Path) and not python_val.is_file():
-                        raise ValueError(f"Error converting pathlib.Path {python_val} because it's not a file.")
-
-                    # If it's a string pointing to a local destination, then make sure it's a file.
-                    if isinstance(python_val, str):
-                        p = pathlib.Path(python_val)
-                        if not p.is_file():
-                            raise TypeTransformerFailedError(f"Error converting {python_val} because it's not a file.")
+                    # If it's a path pointing to a local destination, then make sure it's a file.
+                    if not os.path.isfile(source_path):
+                        if isinstance(python_val, pathlib.Path):
+                            raise ValueError(f"Error converting pathlib.Path {python_val} because it's not a file.")
+                        raise TypeTransformerFailedError(f"Error converting {python_val} because it's not a file.")
+                    self.validate_file_type(python_type, source_path)
             # python_type must be os.PathLike - see check at beginning of function
             else:
                 should_upload = False
@@ -463,11 +553,13 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
 
         # If we're uploading something, that means that the uri should always point to the upload destination.
         if should_upload:
-            headers = self.get_additional_headers(source_path)
+            kwargs: typing.Dict[str, typing.Any] = {**self.get_additional_headers(source_path)}
+            if batch_size is not None:
+                kwargs["batch_size"] = batch_size
             if remote_path is not None:
-                remote_path = ctx.file_access.put_data(source_path, remote_path, is_multipart=False, **headers)
+                remote_path = ctx.file_access.put_data(source_path, remote_path, is_multipart=False, **kwargs)
             else:
-                remote_path = ctx.file_access.put_raw_data(source_path, **headers)
+                remote_path = ctx.file_access.put_raw_data(source_path, **kwargs)
             return Literal(scalar=Scalar(blob=Blob(metadata=meta, uri=remote_path)))
         # If not uploading, then we can only take the original source path as the uri.
         else:
@@ -490,7 +582,8 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
         if lv.scalar.blob.metadata.type.dimensionality != BlobType.BlobDimensionality.SINGLE:
             raise TypeTransformerFailedError(f"{lv.scalar.blob.uri} is not a file.")
 
-        if not ctx.file_access.is_remote(uri) and not os.path.isfile(uri):
+        is_remote = ctx.file_access.is_remote(uri)
+        if not is_remote and not os.path.isfile(uri):
             raise FlyteAssertion(
                 f"Cannot convert from {lv} to {expected_python_type}. " f"Expected a file, but {uri} is not a file."
             )
@@ -504,22 +597,19 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
         expected_python_type = get_underlying_type(expected_python_type)
 
         # The rest of the logic is only for FlyteFile types.
-        if not issubclass(expected_python_type, FlyteFile):  # type: ignore
+        if not _is_flyte_file_type(typing.cast(type, expected_python_type)):
             raise TypeError(f"Neither os.PathLike nor FlyteFile specified {expected_python_type}")
 
         # This is a local file path, like /usr/local/my_file, don't mess with it. Certainly, downloading it doesn't
         # make any sense.
-        if not ctx.file_access.is_remote(uri):
+        if not is_remote:
             return expected_python_type(uri)  # type: ignore
 
         # For the remote case, return an FlyteFile object that can download
         local_path = ctx.file_access.get_random_local_path(uri)
-
-        def _downloader():
-            return ctx.file_access.get_data(uri, local_path, is_multipart=False)
-
-        expected_format = FlyteFilePathTransformer.get_format(expected_python_type)
-        ff = FlyteFile.__class_getitem__(expected_format)(local_path, _downloader)
+        ff = _format_class_for_type(typing.cast(type, expected_python_type))(
+            local_path, _Downloader(ctx.file_access, uri, local_path)
+        )
         ff._remote_source = uri
 
         return ff
@@ -535,4 +625,5 @@ class FlyteFilePathTransformer(TypeTransformer[FlyteFile]):
         raise ValueError(f"Transformer {self} cannot reverse {literal_type}")
 
 
-TypeEngine.register(FlyteFilePathTransformer(), additional_types=[os.PathLike])
+flyte_file_transformer = FlyteFilePathTransformer()
+TypeEngine.register(flyte_file_transformer, additional_types=[os.PathLike])
@@ -53,7 +53,7 @@ class PandasToCSVEncodingHandler(StructuredDatasetEncoder):
         structured_dataset: StructuredDataset,
         structured_dataset_type: StructuredDatasetType,
     ) -> literals.StructuredDataset:
-        uri = typing.cast(str, structured_dataset.uri) or ctx.file_access.get_random_remote_directory()
+        uri = structured_dataset.uri or ctx.file_access.get_random_remote_directory()
         if not ctx.file_access.is_remote(uri):
             Path(uri).mkdir(parents=True, exist_ok=True)
         path = os.path.join(uri, ".csv")
@@ -101,7 +101,7 @@ class PandasToParquetEncodingHandler(StructuredDatasetEncoder):
         structured_dataset: StructuredDataset,
         structured_dataset_type: StructuredDatasetType,
     ) -> literals.StructuredDataset:
-        uri = typing.cast(str, structured_dataset.uri) or ctx.file_access.join(
+        uri = structured_dataset.uri or ctx.file_access.join(
             ctx.file_access.raw_output_prefix, ctx.file_access.get_random_string()
         )
         if not ctx.file_access.is_remote(uri):
@@ -153,7 +153,7 @@ class ArrowToParquetEncodingHandler(StructuredDatasetEncoder):
     ) -> literals.StructuredDataset:
         import pyarrow.parquet as pq
 
-        uri = typing.cast(str, structured_dataset.uri) or ctx.file_access.join(
+        uri = structured_dataset.uri or ctx.file_access.join(
             ctx.file_access.raw_output_prefix, ctx.file_access.get_random_string()
         )
         if not ctx.file_access.is_remote(uri):
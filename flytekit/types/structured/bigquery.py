@@ -29,7 +29,10 @@ def _write_to_bq(structured_dataset: StructuredDataset):
     client = bigquery.Client()
     df = structured_dataset.dataframe
     if isinstance(df, pa.Table):
-        df = df.to_pandas()
+        # The frame is only handed to the BigQuery client, which converts it back to arrow. Keeping one block per
+        # column avoids pandas consolidating the columns into a second copy of the data. The table still belongs to
+        # the caller, so it can't be converted with self_destruct.
+        df = df.to_pandas(split_blocks=True)
     client.load_table_from_dataframe(df, table_id)
 
 
@@ -52,9 +55,7 @@ def _read_from_bq(
 
     stream = read_session.streams[0]
     reader = client.read_rows(stream.name)
-    frames = []
-    for message in reader.rows().pages:
-        frames.append(message.to_dataframe())
+    frames = [message.to_dataframe() for message in reader.rows().pages]
     return pd.concat(frames)
 
 
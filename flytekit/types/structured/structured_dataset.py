@@ -5,6 +5,7 @@ import types
 import typing
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Generator, Optional, Type, Union
 
 import _datetime
@@ -54,13 +55,24 @@ class StructuredDataset(DataClassJSONMixin):
     uri: typing.Optional[str] = field(default=None, metadata=config(mm_field=fields.String()))
     file_format: typing.Optional[str] = field(default=GENERIC_FORMAT, metadata=config(mm_field=fields.String()))
 
+    # uri and file_format carry dataclass defaults on the class, so they still need __dict__.
+    __slots__ = (
+        "_dataframe",
+        "_metadata",
+        "_literal_sd",
+        "_dataframe_type",
+        "_already_uploaded",
+        "__dict__",
+        "__weakref__",
+    )
+
     @classmethod
     def columns(cls) -> typing.Dict[str, typing.Type]:
         return {}
 
     @classmethod
     def column_names(cls) -> typing.List[str]:
-        return [k for k, v in cls.columns().items()]
+        return list(cls.columns())
 
     def __init__(
         self,
@@ -83,6 +95,21 @@ class StructuredDataset(DataClassJSONMixin):
         self._dataframe_type: Optional[DF] = None  # type: ignore
         self._already_uploaded = False
 
+    def __getstate__(self):
+        # Without this, pickling with protocol 0 or 1 fails because of __slots__. __dict__ is returned as is.
+        slots = {
+            s: getattr(self, s)
+            for s in StructuredDataset.__slots__
+            if s not in ("__dict__", "__weakref__") and hasattr(self, s)
+        }
+        return self.__dict__, slots
+
+    def __setstate__(self, state):
+        instance_dict, slots = state
+        self.__dict__.update(instance_dict)
+        for name, value in slots.items():
+            setattr(self, name, value)
+
     @property
     def dataframe(self) -> Optional[DF]:
         return self._dataframe
@@ -278,26 +305,34 @@ class StructuredDatasetDecoder(ABC):
         raise NotImplementedError
 
 
+_SCHEMA_COLUMN_TYPE_TO_SIMPLE_TYPE: Dict[int, int] = {
+    SchemaType.SchemaColumn.SchemaColumnType.INTEGER: type_models.SimpleType.INTEGER,
+    SchemaType.SchemaColumn.SchemaColumnType.FLOAT: type_models.SimpleType.FLOAT,
+    SchemaType.SchemaColumn.SchemaColumnType.STRING: type_models.SimpleType.STRING,
+    SchemaType.SchemaColumn.SchemaColumnType.DATETIME: type_models.SimpleType.DATETIME,
+    SchemaType.SchemaColumn.SchemaColumnType.DURATION: type_models.SimpleType.DURATION,
+    SchemaType.SchemaColumn.SchemaColumnType.BOOLEAN: type_models.SimpleType.BOOLEAN,
+}
+
+
 def convert_schema_type_to_structured_dataset_type(
     column_type: int,
 ) -> int:
-    if column_type == SchemaType.SchemaColumn.SchemaColumnType.INTEGER:
-        return type_models.SimpleType.INTEGER
-    if column_type == SchemaType.SchemaColumn.SchemaColumnType.FLOAT:
-        return type_models.SimpleType.FLOAT
-    if column_type == SchemaType.SchemaColumn.SchemaColumnType.STRING:
-        return type_models.SimpleType.STRING
-    if column_type == SchemaType.SchemaColumn.SchemaColumnType.DATETIME:
-        return type_models.SimpleType.DATETIME
-    if column_type == SchemaType.SchemaColumn.SchemaColumnType.DURATION:
-        return type_models.SimpleType.DURATION
-    if column_type == SchemaType.SchemaColumn.SchemaColumnType.BOOLEAN:
-        return type_models.SimpleType.BOOLEAN
-    else:
+    simple_type = _SCHEMA_COLUMN_TYPE_TO_SIMPLE_TYPE.get(column_type)
+    if simple_type is None:
         raise AssertionError(f"Unrecognized SchemaColumnType: {column_type}")
+    return simple_type
 
 
-def get_supported_types():
+@lru_cache(maxsize=None)
+def get_supported_types() -> typing.Mapping[Type, LiteralType]:
+    """
+    Returns the column types a StructuredDataset schema supports, mapped to their literal types. The mapping is
+    read-only and shared by every caller.
+    """
+    # Built on first use rather than at import time so numpy is only imported when it's needed. The table is shared
+    # by every caller. The proxy only stops callers adding or replacing entries; the LiteralType values themselves
+    # are shared as well and must not be mutated.
     import numpy as _np
 
     _SUPPORTED_TYPES: typing.Dict[Type, LiteralType] = {  # type: ignore
@@ -320,7 +355,33 @@ def get_supported_types():
         _np.object_: type_models.LiteralType(simple=type_models.SimpleType.STRING),
         str: type_models.LiteralType(simple=type_models.SimpleType.STRING),
     }
-    return _SUPPORTED_TYPES
+    return types.MappingProxyType(_SUPPORTED_TYPES)
+
+
+@lru_cache(maxsize=1024)
+def _resolve_dataset_column_type(t: typing.Any) -> typing.Tuple[typing.Tuple[str, ...], int]:
+    # Column types repeat a lot across schemas (int, float, str, ...), so each one is resolved once, to the list/dict
+    # nesting around it and its simple type. The LiteralType itself is not cached: literal types can be mutated in
+    # place once they are part of an interface, so every column builds its own from the cached resolution.
+    supported_types = get_supported_types()
+    if t in supported_types:
+        return (), supported_types[t].simple
+    origin = get_origin(t)
+    if origin is list:
+        containers, simple = _resolve_dataset_column_type(get_args(t)[0])
+        return ("collection_type", *containers), simple
+    if origin is dict:
+        containers, simple = _resolve_dataset_column_type(get_args(t)[1])
+        return ("map_value_type", *containers), simple
+    raise AssertionError(f"type {t} is currently not supported by StructuredDataset")
+
+
+def _get_dataset_column_literal_type(t: typing.Any) -> type_models.LiteralType:
+    containers, simple = _resolve_dataset_column_type(t)
+    literal_type = type_models.LiteralType(simple=simple)
+    for container in reversed(containers):
+        literal_type = type_models.LiteralType(**{container: literal_type})
+    return literal_type
 
 
 class DuplicateHandlerError(ValueError):
@@ -342,6 +403,10 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
     Handlers = Union[StructuredDatasetEncoder, StructuredDatasetDecoder]
     Renderers: Dict[Type, Renderable] = {}
 
+    # Handlers found by get_encoder/get_decoder, keyed by (kind, dataframe type, protocol, format), so the fallback
+    # search in _finder only runs once per combination. Cleared whenever a handler is registered.
+    _RESOLVED_HANDLERS: Dict[typing.Tuple[str, Type, str, str], Handlers] = {}
+
     @classmethod
     def _finder(cls, handler_map, df_type: Type, protocol: str, format: str):
         # If there's an exact match, then we should use it.
@@ -366,7 +431,7 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
                     fsspec_handler = fss_handlers[default_format]
                 else:
                     if len(fss_handlers) == 1 and format == GENERIC_FORMAT:
-                        single_handler = list(fss_handlers.values())[0]
+                        single_handler = next(iter(fss_handlers.values()))
                     else:
                         ...
         except KeyError:
@@ -381,7 +446,7 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
                     protocol_specific_handler = protocol_handlers[default_format]
                 else:
                     if len(protocol_handlers) == 1:
-                        single_handler = list(protocol_handlers.values())[0]
+                        single_handler = next(iter(protocol_handlers.values()))
                     else:
                         ...
 
@@ -395,11 +460,21 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
 
     @classmethod
     def get_encoder(cls, df_type: Type, protocol: str, format: str):
-        return cls._finder(StructuredDatasetTransformerEngine.ENCODERS, df_type, protocol, format)
+        key = ("encoder", df_type, protocol, format)
+        handler = cls._RESOLVED_HANDLERS.get(key)
+        if handler is None:
+            handler = cls._finder(StructuredDatasetTransformerEngine.ENCODERS, df_type, protocol, format)
+            cls._RESOLVED_HANDLERS[key] = handler
+        return handler
 
     @classmethod
     def get_decoder(cls, df_type: Type, protocol: str, format: str):
-        return cls._finder(StructuredDatasetTransformerEngine.DECODERS, df_type, protocol, format)
+        key = ("decoder", df_type, protocol, format)
+        handler = cls._RESOLVED_HANDLERS.get(key)
+        if handler is None:
+            handler = cls._finder(StructuredDatasetTransformerEngine.DECODERS, df_type, protocol, format)
+            cls._RESOLVED_HANDLERS[key] = handler
+        return handler
 
     @classmethod
     def _handler_finder(cls, h: Handlers, protocol: str) -> Dict[str, Handlers]:
@@ -409,11 +484,7 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
             top_level = cls.DECODERS  # type: ignore
         else:
             raise TypeError(f"We don't support this type of handler {h}")
-        if h.python_type not in top_level:
-            top_level[h.python_type] = {}
-        if protocol not in top_level[h.python_type]:
-            top_level[h.python_type][protocol] = {}
-        return top_level[h.python_type][protocol]  # type: ignore
+        return top_level.setdefault(h.python_type, {}).setdefault(protocol, {})  # type: ignore
 
     def __init__(self):
         super().__init__("StructuredDataset Transformer", StructuredDataset)
@@ -450,7 +521,7 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
         :param default_storage_for_type: Same as above but only for the storage format. Error if already set,
           unless override is specified.
         """
-        if not (isinstance(h, StructuredDatasetEncoder) or isinstance(h, StructuredDatasetDecoder)):
+        if not isinstance(h, (StructuredDatasetEncoder, StructuredDatasetDecoder)):
             raise TypeError(f"We don't support this type of handler {h}")
 
         if h.protocol is None:
@@ -491,6 +562,7 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
                 f"Already registered a handler for {(h.python_type, protocol, h.supported_format)}"
             )
         lowest_level[h.supported_format] = h
+        cls._RESOLVED_HANDLERS.clear()
         logger.debug(f"Registered {h} as handler for {h.python_type}, protocol {protocol}, fmt {h.supported_format}")
 
         if (default_format_for_type or default_for_type) and h.supported_format != GENERIC_FORMAT:
@@ -516,8 +588,7 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
         # Register with the type engine as well
         # The semantics as of now are such that it doesn't matter which order these transformers are loaded in, as
         # long as the older Pandas/FlyteSchema transformer do not also specify the override
-        engine = StructuredDatasetTransformerEngine()
-        TypeEngine.register_additional_type(engine, h.python_type, override=True)
+        TypeEngine.register_additional_type(flyte_dataset_transformer, h.python_type, override=True)
 
     def assert_type(self, t: Type[StructuredDataset], v: typing.Any):
         return
@@ -529,19 +600,9 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
         python_type: Union[Type[StructuredDataset], Type],
         expected: LiteralType,
     ) -> Literal:
-        # Make a copy in case we need to hand off to encoders, since we can't be sure of mutations.
         # Check first to see if it's even an SD type. For backwards compatibility, we may be getting a FlyteSchema
         python_type, *attrs = extract_cols_and_format(python_type)
-        # In case it's a FlyteSchema
-        sdt = StructuredDatasetType(format=self.DEFAULT_FORMATS.get(python_type, GENERIC_FORMAT))
-
-        if expected and expected.structured_dataset_type:
-            sdt = StructuredDatasetType(
-                columns=expected.structured_dataset_type.columns,
-                format=expected.structured_dataset_type.format,
-                external_schema_type=expected.structured_dataset_type.external_schema_type,
-                external_schema_bytes=expected.structured_dataset_type.external_schema_bytes,
-            )
+        default_format = self.DEFAULT_FORMATS.get(python_type, GENERIC_FORMAT)
 
         # If the type signature has the StructuredDataset class, it will, or at least should, also be a
         # StructuredDataset instance.
@@ -578,7 +639,9 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
                     uri = ctx.file_access.put_raw_data(uri)
                 sd_model = literals.StructuredDataset(
                     uri=uri,
-                    metadata=StructuredDatasetMetadata(structured_dataset_type=sdt),
+                    metadata=StructuredDatasetMetadata(
+                        structured_dataset_type=self._structured_dataset_type_for(expected, default_format)
+                    ),
                 )
                 return Literal(scalar=Scalar(structured_dataset=sd_model))
 
@@ -586,6 +649,7 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
             # that we will need to invoke an encoder for. Figure out which encoder to call and invoke it.
             df_type = type(python_val.dataframe)
             protocol = self._protocol_from_type_or_prefix(ctx, df_type, python_val.uri)
+            sdt = self._structured_dataset_type_for(expected, default_format)
             return self.encode(
                 ctx,
                 python_val,
@@ -596,20 +660,39 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
             )
 
         # Otherwise assume it's a dataframe instance. Wrap it with some defaults
-        fmt = self.DEFAULT_FORMATS.get(python_type, "")
         protocol = self._protocol_from_type_or_prefix(ctx, python_type)
         meta = StructuredDatasetMetadata(structured_dataset_type=expected.structured_dataset_type if expected else None)
 
         sd = StructuredDataset(dataframe=python_val, metadata=meta)
-        return self.encode(ctx, sd, python_type, protocol, fmt, sdt)
+        sdt = self._structured_dataset_type_for(expected, default_format)
+        return self.encode(ctx, sd, python_type, protocol, default_format, sdt)
+
+    @staticmethod
+    def _structured_dataset_type_for(expected: LiteralType, default_format: str) -> StructuredDatasetType:
+        """
+        Builds the StructuredDatasetType for a new literal. Only called by the cases that create one, so returning a
+        passthrough literal doesn't pay for it.
+        """
+        if expected and expected.structured_dataset_type:
+            # Make a copy in case we need to hand off to encoders, since we can't be sure of mutations.
+            expected_sdt = expected.structured_dataset_type
+            return StructuredDatasetType(
+                columns=expected_sdt.columns,
+                format=expected_sdt.format,
+                external_schema_type=expected_sdt.external_schema_type,
+                external_schema_bytes=expected_sdt.external_schema_bytes,
+            )
+        # In case it's a FlyteSchema
+        return StructuredDatasetType(format=default_format)
 
     def _protocol_from_type_or_prefix(self, ctx: FlyteContext, df_type: Type, uri: Optional[str] = None) -> str:
         """
         Get the protocol from the default, if missing, then look it up from the uri if provided, if not then look
         up from the provided context's file access.
         """
-        if df_type in self.DEFAULT_PROTOCOLS:
-            return self.DEFAULT_PROTOCOLS[df_type]
+        protocol = self.DEFAULT_PROTOCOLS.get(df_type)
+        if protocol is not None:
+            return protocol
         else:
             protocol = get_protocol(uri or ctx.file_access.raw_output_prefix)
             logger.debug(
@@ -691,15 +774,15 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
             if column_dict is None or len(column_dict) == 0:
                 final_dataset_columns = []
                 if schema_columns is not None and schema_columns != []:
-                    for c in schema_columns:
-                        final_dataset_columns.append(
-                            StructuredDatasetType.DatasetColumn(
-                                name=c.name,
-                                literal_type=LiteralType(
-                                    simple=convert_schema_type_to_structured_dataset_type(c.type),
-                                ),
-                            )
+                    final_dataset_columns = [
+                        StructuredDatasetType.DatasetColumn(
+                            name=c.name,
+                            literal_type=LiteralType(
+                                simple=convert_schema_type_to_structured_dataset_type(c.type),
+                            ),
                         )
+                        for c in schema_columns
+                    ]
                 # Dataframe will always be serialized to parquet file by FlyteSchema transformer
                 new_sdt = StructuredDatasetType(columns=final_dataset_columns, format=PARQUET)
             else:
@@ -745,6 +828,8 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
         # A StructuredDataset type, for example
         #   t1(input_a: StructuredDataset)  # or
         #   t1(input_a: Annotated[StructuredDataset, my_cols])
+        # Nothing is read here, not even in the background. Decoders read straight from the uri, usually only the
+        # requested columns, and only once the user calls open(), which may never happen.
         if issubclass(expected_python_type, StructuredDataset):
             sd = expected_python_type(
                 dataframe=None,
@@ -765,7 +850,7 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
                 df = python_val.dataframe
             else:
                 # Here we only render column information by default instead of opening the structured dataset.
-                col = typing.cast(StructuredDataset, python_val).columns()
+                col = python_val.columns()
                 df = pd.DataFrame(col, ["column type"])
                 return df.to_html()  # type: ignore
         else:
@@ -812,26 +897,22 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
         return result
 
     def _get_dataset_column_literal_type(self, t: Type) -> type_models.LiteralType:
-        if t in get_supported_types():
-            return get_supported_types()[t]
-        if hasattr(t, "__origin__") and t.__origin__ == list:
-            return type_models.LiteralType(collection_type=self._get_dataset_column_literal_type(t.__args__[0]))
-        if hasattr(t, "__origin__") and t.__origin__ == dict:
-            return type_models.LiteralType(map_value_type=self._get_dataset_column_literal_type(t.__args__[1]))
-        raise AssertionError(f"type {t} is currently not supported by StructuredDataset")
+        return _get_dataset_column_literal_type(t)
 
     def _convert_ordered_dict_of_columns_to_list(
         self, column_map: typing.Optional[typing.OrderedDict[str, Type]]
     ) -> typing.List[StructuredDatasetType.DatasetColumn]:
-        converted_cols: typing.List[StructuredDatasetType.DatasetColumn] = []
         if column_map is None or len(column_map) == 0:
-            return converted_cols
-        for k, v in column_map.items():
-            lt = self._get_dataset_column_literal_type(v)
-            converted_cols.append(StructuredDatasetType.DatasetColumn(name=k, literal_type=lt))
-        return converted_cols
+            return []
+        get_literal_type = self._get_dataset_column_literal_type
+        return [
+            StructuredDatasetType.DatasetColumn(name=k, literal_type=get_literal_type(v)) for k, v in column_map.items()
+        ]
 
     def _get_dataset_type(self, t: typing.Union[Type[StructuredDataset], typing.Any]) -> StructuredDatasetType:
+        # This isn't memoized per type. Annotated types carrying a kwtypes column dict aren't hashable, and arrow
+        # schemas that differ only in field metadata hash and compare equal but serialize differently. The expensive
+        # part, resolving each column's literal type, is cached in _resolve_dataset_column_type instead.
         original_python_type, column_map, storage_format, pa_schema = extract_cols_and_format(t)  # type: ignore
 
         # Get the column information
@@ -843,7 +924,7 @@ class StructuredDatasetTransformerEngine(TypeTransformer[StructuredDataset]):
             columns=converted_cols,
             format=storage_format,
             external_schema_type="arrow" if pa_schema else None,
-            external_schema_bytes=typing.cast(pa.lib.Schema, pa_schema).to_string().encode() if pa_schema else None,
+            external_schema_bytes=pa_schema.to_string().encode() if pa_schema else None,
         )
 
     def get_literal_type(self, t: typing.Union[Type[StructuredDataset], typing.Any]) -> LiteralType:
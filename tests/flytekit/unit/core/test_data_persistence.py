@@ -11,6 +11,7 @@ import pytest
 from azure.identity import ClientSecretCredential, DefaultAzureCredential
 
 from flytekit.core.data_persistence import FileAccessProvider
+from flytekit.exceptions.user import FlyteAssertion
 
 
 def test_get_manual_random_remote_path():
@@ -26,6 +27,10 @@ def test_is_remote():
     assert fp.is_remote("/tmp/foo/bar") is False
     assert fp.is_remote("file://foo/bar") is False
     assert fp.is_remote("s3://my-bucket/foo/bar") is True
+    assert fp.is_remote("file:///tmp/foo/bar") is False
+    assert fp.is_remote(pathlib.Path("/tmp/foo/bar")) is False
+    assert fp.is_remote("https://example.com/foo.csv") is True
+    assert fp.is_remote("flyte://data/foo") is True
 
 
 @pytest.mark.skipif("pandas" not in sys.modules, reason="Pandas is not installed.")
@@ -136,6 +141,78 @@ def test_write_known_location():
         assert f.read() == arbitrary_text.encode("utf-8")
 
 
+def test_put_raw_data_invalid_paths():
+    random_dir = tempfile.mkdtemp()
+    fs = FileAccessProvider(local_sandbox_dir=random_dir, raw_output_prefix=os.path.join(random_dir, "raw"))
+    with pytest.raises(FlyteAssertion, match="does not exist"):
+        fs.put_raw_data(os.path.join(random_dir, "missing.txt"))
+
+    if os.name != "nt":
+        target = os.path.join(random_dir, "target.txt")
+        with open(target, "w") as f:
+            f.write("hello")
+        link = os.path.join(random_dir, "link.txt")
+        os.symlink(target, link)
+        with pytest.raises(FlyteAssertion, match="is a symlink"):
+            fs.put_raw_data(link)
+
+
+def test_put_single_file_to_object_store():
+    fp = FileAccessProvider("/tmp", "s3://my-bucket")
+    mock_fs = mock.MagicMock()
+    mock_fs.sep = "/"
+    with tempfile.NamedTemporaryFile() as f, mock.patch.object(fp, "get_filesystem_for_path", return_value=mock_fs):
+        assert fp.put(f.name, "s3://my-bucket/a.txt", batch_size=2) == "s3://my-bucket/a.txt"
+        mock_fs.put.assert_not_called()
+        mock_fs.pipe.assert_not_called()
+        mock_fs.put_file.assert_called_once()
+        args, kwargs = mock_fs.put_file.call_args
+        assert args == (f.name, "s3://my-bucket/a.txt")
+        assert kwargs["chunksize"] > 0
+        assert "batch_size" not in kwargs
+
+
+def test_put_single_file_caps_multipart_concurrency():
+    class MultipartFileSystem(mock.MagicMock):
+        async def _put_file(self, lpath, rpath, chunksize=50 * 2**20, max_concurrency=None, **kwargs):
+            ...
+
+    fp = FileAccessProvider("/tmp", "s3://my-bucket")
+    mock_fs = MultipartFileSystem()
+    mock_fs.sep = "/"
+    with tempfile.NamedTemporaryFile() as f, mock.patch.object(fp, "get_filesystem_for_path", return_value=mock_fs):
+        fp.put(f.name, "s3://my-bucket/a.txt", batch_size=4)
+        assert mock_fs.put_file.call_args.kwargs["max_concurrency"] == 4
+
+
+@pytest.mark.parametrize("size, ranged", [(10, False), (40, True)])
+def test_get_single_file_from_object_store(size, ranged):
+    fp = FileAccessProvider("/tmp", "s3://my-bucket")
+    data = bytes(i % 256 for i in range(size))
+    mock_fs = mock.MagicMock()
+    mock_fs.protocol = ("s3", "s3a")
+    mock_fs.sep = "/"
+    mock_fs.size.return_value = size
+    mock_fs.cat_ranges.side_effect = lambda paths, starts, ends, **kwargs: [data[s:e] for s, e in zip(starts, ends)]
+    with tempfile.TemporaryDirectory() as d, mock.patch.multiple(
+        "flytekit.core.data_persistence",
+        _RANGED_DOWNLOAD_THRESHOLD=16,
+        _RANGED_DOWNLOAD_CHUNKSIZE=4,
+        _RANGED_DOWNLOAD_MAX_CONCURRENCY=3,
+    ), mock.patch.object(fp, "get_filesystem_for_path", return_value=mock_fs):
+        local_path = os.path.join(d, "a.txt")
+        assert fp.get("s3://my-bucket/a.txt", local_path) == local_path
+        mock_fs.get.assert_not_called()
+        if ranged:
+            mock_fs.get_file.assert_not_called()
+            assert mock_fs.cat_ranges.call_count == 4
+            with open(local_path, "rb") as f:
+                assert f.read() == data
+        else:
+            mock_fs.cat_ranges.assert_not_called()
+            mock_fs.get_file.assert_called_once_with("s3://my-bucket/a.txt", local_path)
+
+
 def test_initialise_azure_file_provider_with_account_key():
     with mock.patch.dict(
         os.environ,
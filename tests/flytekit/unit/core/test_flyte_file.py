@@ -1,6 +1,10 @@
+import contextlib
 import os
 import pathlib
+import pickle
 import tempfile
+import threading
+import time
 import typing
 from unittest.mock import MagicMock, patch
 
@@ -15,11 +19,11 @@ from flytekit.core.dynamic_workflow_task import dynamic
 from flytekit.core.hash import HashMethod
 from flytekit.core.launch_plan import LaunchPlan
 from flytekit.core.task import task
-from flytekit.core.type_engine import TypeEngine
+from flytekit.core.type_engine import BatchSize, TypeEngine, TypeTransformerFailedError
 from flytekit.core.workflow import workflow
 from flytekit.models.core.types import BlobType
-from flytekit.models.literals import LiteralMap
-from flytekit.types.file.file import FlyteFile, FlyteFilePathTransformer
+from flytekit.models.literals import Blob, BlobMetadata, Literal, LiteralMap, Scalar
+from flytekit.types.file.file import FlyteFile, FlyteFilePathTransformer, flyte_file_transformer
 
 
 # Fixture that ensures a dummy local file
@@ -414,6 +418,38 @@ def test_download_caching():
     for _ in range(10):
         os.fspath(f)
     assert mock_downloader.call_count == 1
+    assert f._downloader is not mock_downloader
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_file_is_picklable_with_every_protocol(protocol):
+    f = FlyteFile("/tmp/x", remote_path="s3://my-bucket/x")
+    restored = pickle.loads(pickle.dumps(f, protocol=protocol))
+    assert restored == f
+    assert restored.remote_path == "s3://my-bucket/x"
+    csv = pickle.loads(pickle.dumps(FlyteFile["csv"]("/tmp/x"), protocol=protocol))
+    assert csv.extension() == "csv"
+    assert csv.path == "/tmp/x"
+
+
+def test_remote_file_is_picklable():
+    ctx = FlyteContextManager.current_context()
+    lv = Literal(
+        scalar=Scalar(
+            blob=Blob(
+                metadata=BlobMetadata(type=BlobType(format="csv", dimensionality=BlobType.BlobDimensionality.SINGLE)),
+                uri="s3://my-bucket/file.csv",
+            )
+        )
+    )
+    f = FlyteFilePathTransformer().to_python_value(ctx, lv, FlyteFile["csv"])
+    f = pickle.loads(pickle.dumps(f))
+    assert f.remote_source == "s3://my-bucket/file.csv"
+    assert not f.downloaded
+
+    with patch.object(FileAccessProvider, "get_data") as mock_get_data:
+        os.fspath(f)
+    mock_get_data.assert_called_once_with("s3://my-bucket/file.csv", f.path, is_multipart=False)
 
 
 def test_returning_a_pathlib_path(local_dummy_file):
@@ -660,3 +696,168 @@ def test_join():
 def test_headers():
     assert FlyteFilePathTransformer.get_additional_headers("xyz") == {}
     assert len(FlyteFilePathTransformer.get_additional_headers(".gz")) == 1
+
+
+@patch("flytekit.core.data_persistence.FileAccessProvider.put_raw_data")
+def test_flyte_file_batch_size(mock_put_raw_data, local_dummy_file):
+    mock_put_raw_data.return_value = "s3://my-bucket/file"
+    ctx = FlyteContextManager.current_context()
+    tf = FlyteFilePathTransformer()
+    t = Annotated[FlyteFile, BatchSize(4)]
+    lv = tf.to_literal(ctx, local_dummy_file, t, tf.get_literal_type(FlyteFile))
+    assert lv.scalar.blob.uri == "s3://my-bucket/file"
+    assert mock_put_raw_data.call_args.kwargs["batch_size"] == 4
+
+    tf.to_literal(ctx, local_dummy_file, FlyteFile, tf.get_literal_type(FlyteFile))
+    assert "batch_size" not in mock_put_raw_data.call_args.kwargs
+
+
+def test_blob_metadata_is_shared():
+    ctx = FlyteContextManager.current_context()
+    tf = FlyteFilePathTransformer()
+    t = FlyteFile["csv"]
+    lv1 = tf.to_literal(ctx, "s3://my-bucket/a.csv", t, tf.get_literal_type(t))
+    lv2 = tf.to_literal(ctx, "s3://my-bucket/b.csv", t, tf.get_literal_type(t))
+    assert lv1.scalar.blob.metadata is lv2.scalar.blob.metadata
+    assert lv1.scalar.blob.metadata.type.format == "csv"
+    assert tf.get_literal_type(t) is not tf.get_literal_type(t)
+
+
+def test_to_literal_not_a_file():
+    ctx = FlyteContextManager.current_context()
+    tf = FlyteFilePathTransformer()
+    lt = tf.get_literal_type(FlyteFile)
+    with tempfile.TemporaryDirectory() as d:
+        with pytest.raises(ValueError, match="because it's not a file"):
+            tf.to_literal(ctx, pathlib.Path(d), FlyteFile, lt)
+        with pytest.raises(TypeTransformerFailedError, match="because it's not a file"):
+            tf.to_literal(ctx, d, FlyteFile, lt)
+
+
+def test_format_class_is_reused():
+    assert FlyteFile["csv"] is FlyteFile["csv"]
+    assert FlyteFile["csv"] is FlyteFile[".csv"]
+    assert FlyteFile["csv"] is not FlyteFile["txt"]
+    assert FlyteFile["csv"].extension() == "csv"
+    assert FlyteFile[""] is FlyteFile
+
+
+def test_eq_with_overridden_extension():
+    class MyCSV(FlyteFile):
+        @classmethod
+        def extension(cls) -> str:
+            return "csv"
+
+    assert MyCSV("/tmp/x") == FlyteFile["csv"]("/tmp/x")
+    assert FlyteFile["csv"]("/tmp/x") == MyCSV("/tmp/x")
+    assert MyCSV("/tmp/x") != FlyteFile["txt"]("/tmp/x")
+    assert MyCSV("/tmp/x") != FlyteFile("/tmp/x")
+
+
+@contextlib.contextmanager
+def _converted_concurrently(n: int):
+    """
+    Patches FlyteFilePathTransformer.to_literal so that it only returns once n files are being converted at the same
+    time. Serial conversion times out on the barrier.
+    """
+    barrier = threading.Barrier(n, timeout=10)
+    to_literal = FlyteFilePathTransformer.to_literal
+
+    def waiting_to_literal(self, *args, **kwargs):
+        barrier.wait()
+        return to_literal(self, *args, **kwargs)
+
+    with patch.object(FlyteFilePathTransformer, "to_literal", waiting_to_literal):
+        yield
+
+
+def test_multiple_file_outputs_are_converted_concurrently(local_dummy_file):
+    @task
+    def t1() -> typing.Tuple[FlyteFile, int, FlyteFile]:
+        return local_dummy_file, 3, local_dummy_file
+
+    with _converted_concurrently(2):
+        a, b, c = t1()
+    assert b == 3
+    with open(a) as fa, open(c) as fc:
+        assert fa.read() == fc.read() == "Hello world"
+
+
+def test_file_list_is_converted_concurrently(local_dummy_file):
+    @task
+    def t1() -> typing.List[FlyteFile]:
+        return [local_dummy_file] * 3
+
+    with _converted_concurrently(3):
+        files = t1()
+    assert len(files) == 3
+    for f in files:
+        with open(f) as fh:
+            assert fh.read() == "Hello world"
+
+
+def test_file_list_conversion_error_cancels_queued_uploads(local_dummy_file):
+    calls = []
+
+    def failing_to_literal(self, *args, **kwargs):
+        calls.append(args)
+        if len(calls) == 1:
+            raise ValueError("upload failed")
+        # Give the failure time to reach the caller, which cancels whatever is still queued.
+        time.sleep(0.2)
+        return Literal()
+
+    ctx = FlyteContextManager.current_context()
+    pt = typing.List[FlyteFile]
+    with patch("flytekit.core.type_engine.MAX_CONCURRENT_BLOB_UPLOADS", 1), patch.object(
+        FlyteFilePathTransformer, "to_literal", failing_to_literal
+    ):
+        with pytest.raises(ValueError, match="upload failed"):
+            TypeEngine.to_literal(ctx, [local_dummy_file] * 5, pt, TypeEngine.to_literal_type(pt))
+    assert len(calls) <= 2
+
+
+def test_remote_file_list_is_converted_serially():
+    ctx = FlyteContextManager.current_context()
+    pt = typing.List[FlyteFile]
+    with patch("flytekit.core.type_engine.ThreadPoolExecutor") as executor:
+        lv = TypeEngine.to_literal(ctx, ["s3://bucket/a", "s3://bucket/b"], pt, TypeEngine.to_literal_type(pt))
+    executor.assert_not_called()
+    assert [lit.scalar.blob.uri for lit in lv.collection.literals] == ["s3://bucket/a", "s3://bucket/b"]
+
+
+def test_only_local_file_outputs_are_converted_concurrently():
+    @task
+    def t1() -> typing.Tuple[typing.Any, typing.Any, FlyteFile, FlyteFile]:
+        return 1, 2, "s3://bucket/a", "s3://bucket/b"
+
+    with patch("flytekit.core.base_task.ThreadPoolExecutor") as executor:
+        a, b, c, d = t1()
+    executor.assert_not_called()
+    assert (a, b) == (1, 2)
+    assert (c.remote_source, d.remote_source) == ("s3://bucket/a", "s3://bucket/b")
+
+
+def test_multiple_file_outputs_conversion_error():
+    @task
+    def t1() -> typing.Tuple[FlyteFile, FlyteFile]:
+        return __file__, "/does/not/exist"
+
+    with pytest.raises(TypeError, match="Failed to convert outputs of task '.*' at position 1"):
+        t1()
+
+
+def test_get_format_is_interned():
+    class MyFile(FlyteFile):
+        @classmethod
+        def extension(cls) -> str:
+            return "".join(["c", "s", "v"])
+
+    assert FlyteFilePathTransformer.get_format(MyFile) is FlyteFilePathTransformer.get_format(FlyteFile["csv"])
+    assert FlyteFilePathTransformer.get_format(os.PathLike) == ""
+
+
+def test_file_transformer_is_shared():
+    assert TypeEngine.get_transformer(FlyteFile) is flyte_file_transformer
+    assert TypeEngine.get_transformer(FlyteFile["csv"]) is flyte_file_transformer
+    assert TypeEngine.get_transformer(os.PathLike) is flyte_file_transformer
@@ -3,6 +3,8 @@ import pytest
 from typing_extensions import Annotated
 
 from flytekit import StructuredDataset, kwtypes, task, workflow
+from flytekit.core.context_manager import FlyteContextManager
+from flytekit.models.types import StructuredDatasetType
 
 pd = pytest.importorskip("pandas")
 
@@ -49,3 +51,18 @@ def test_bq_wf(mock_read_rows_stream, mock_bigquery_read_client, mock_client):
     mock_bigquery_read_client.return_value = mock_bigquery_read_client
 
     assert wf().equals(pd_df)
+
+
+@mock.patch("google.cloud.bigquery.Client")
+def test_arrow_to_bq(mock_client):
+    pa = pytest.importorskip("pyarrow")
+    from flytekit.types.structured.bigquery import ArrowToBQEncodingHandlers
+
+    mock_client.return_value = mock_client
+    table = pa.Table.from_pandas(pd_df)
+    sd = StructuredDataset(dataframe=table, uri="bq://project:flyte.table")
+    ArrowToBQEncodingHandlers().encode(FlyteContextManager.current_context(), sd, StructuredDatasetType(format=""))
+
+    df, table_id = mock_client.load_table_from_dataframe.call_args[0]
+    assert table_id == "project.flyte.table"
+    assert df.equals(pd_df)
@@ -1,6 +1,8 @@
 import os
+import pickle
 import tempfile
 import typing
+import weakref
 
 import google.cloud.bigquery
 import pyarrow as pa
@@ -28,6 +30,7 @@ from flytekit.types.structured.structured_dataset import (
     StructuredDatasetTransformerEngine,
     convert_schema_type_to_structured_dataset_type,
     extract_cols_and_format,
+    get_supported_types,
 )
 
 pd = pytest.importorskip("pandas")
@@ -155,6 +158,34 @@ def test_types_annotated():
         TypeEngine.to_literal_type(pt)
 
 
+def test_column_literal_types_are_not_shared():
+    lt1 = TypeEngine.to_literal_type(Annotated[pd.DataFrame, kwtypes(a=int, b=typing.List[int])])
+    lt2 = TypeEngine.to_literal_type(Annotated[pd.DataFrame, kwtypes(c=int, d=typing.List[int])])
+    for c1, c2 in zip(lt1.structured_dataset_type.columns, lt2.structured_dataset_type.columns):
+        assert c1.literal_type == c2.literal_type
+        assert c1.literal_type is not c2.literal_type
+
+
+def test_supported_types_are_read_only():
+    assert get_supported_types() is get_supported_types()
+    with pytest.raises(TypeError):
+        get_supported_types()[bytes] = get_supported_types()[str]
+
+
+def test_structured_dataset_is_weakly_referenceable():
+    sd = StructuredDataset(uri="x")
+    assert weakref.ref(sd)() is sd
+
+
+@pytest.mark.parametrize("protocol", range(pickle.HIGHEST_PROTOCOL + 1))
+def test_structured_dataset_is_picklable_with_every_protocol(protocol):
+    sd = StructuredDataset(uri="s3://my-bucket/sd", file_format="parquet")
+    restored = pickle.loads(pickle.dumps(sd, protocol=protocol))
+    assert (restored.uri, restored.file_format) == ("s3://my-bucket/sd", "parquet")
+    assert restored.dataframe is None
+    assert not restored._already_uploaded
+
+
 def test_types_sd():
     pt = StructuredDataset
     lt = TypeEngine.to_literal_type(pt)
@@ -292,6 +323,32 @@ def test_slash_register():
     assert res is not None
 
 
+def test_resolved_handlers_are_reset_on_register():
+    class ResolvedDF:
+        ...
+
+    class TempEncoder(StructuredDatasetEncoder):
+        def __init__(self):
+            super().__init__(ResolvedDF, None, supported_format="")
+
+        def encode(
+            self,
+            ctx: FlyteContext,
+            structured_dataset: StructuredDataset,
+            structured_dataset_type: StructuredDatasetType,
+        ) -> literals.StructuredDataset:
+            return literals.StructuredDataset(uri="")
+
+    first = TempEncoder()
+    StructuredDatasetTransformerEngine.register(first)
+    assert StructuredDatasetTransformerEngine.get_encoder(ResolvedDF, "s3", PARQUET) is first
+    assert StructuredDatasetTransformerEngine.get_encoder(ResolvedDF, "s3", PARQUET) is first
+
+    second = TempEncoder()
+    StructuredDatasetTransformerEngine.register(second, override=True)
+    assert StructuredDatasetTransformerEngine.get_encoder(ResolvedDF, "s3", PARQUET) is second
+
+
 def test_sd():
     sd = StructuredDataset(dataframe="hi")
     sd.uri = "my uri"